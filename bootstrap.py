@@ -23,6 +23,7 @@ from pathlib import Path
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import parse_qs, urlencode, urlparse
 import httpx
+import orjson
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -150,9 +151,10 @@ def exchange_code_for_token(code: str) -> dict:
         "redirect_uri": REDIRECT_URI,
     }
 
-    response = httpx.post(TOKEN_URL, data=data)
+    with httpx.Client(http2=True, timeout=30.0) as client:
+        response = client.post(TOKEN_URL, data=data)
     response.raise_for_status()
-    return response.json()
+    return orjson.loads(response.content)
 
 
 def main():
@@ -201,11 +203,13 @@ def main():
     print("   Waiting for authorization...")
     print()
 
-    server = HTTPServer(("localhost", 8080), CallbackHandler)
-
-    # Handle one request (the callback)
-    while auth_code is None and auth_error is None:
-        server.handle_request()
+    # Serve until the callback arrives. Other requests (such as the browser
+    # asking for a favicon) get a 404 and don't end the wait, since every
+    # response to /callback sets either auth_code or auth_error. The socket is
+    # closed as soon as the callback has been handled.
+    with HTTPServer(("localhost", 8080), CallbackHandler) as server:
+        while auth_code is None and auth_error is None:
+            server.handle_request()
 
     if auth_error:
         print(f"❌ Authorization failed: {auth_error}")
@@ -2,46 +2,110 @@
 WHOOP Data Formatters
 
 Functions to format WHOOP API responses into human-readable text.
-"""
-
 
-def format_workout(workout: dict) -> str:
-    """Format a workout record into human-readable text."""
-    lines = []
+Each format_* function appends the lines for one record to a shared list,
+and format_response joins a whole API response into a single string.
+"""
 
+from typing import Any, Callable, Optional
+
+# A score field as (key, label or prefix, format spec, unit suffix, scale)
+_ScoreField = tuple[str, str, str, str, Optional[float]]
+
+# Unit conversion factors applied to raw API values
+_MS_TO_MIN = 1.0 / 60000.0
+_M_TO_KM = 0.001
+
+
+def _compile_fields(fields: tuple[_ScoreField, ...]) -> tuple[_ScoreField, ...]:
+    """
+    Precompute the line prefix for each field in a score table.
+
+    Turns (key, label, spec, suffix, scale) entries into
+    (key, prefix, spec, suffix, scale) so formatting a record only
+    concatenates strings instead of building an f-string per field.
+    """
+    return tuple(
+        (key, f"  {label}: ", spec, suffix, scale)
+        for key, label, spec, suffix, scale in fields
+    )
+
+
+# Score fields rendered by each formatter, in display order.
+# Each entry is (key, label, format spec, unit suffix, scale), where scale is
+# an optional conversion factor the raw value is multiplied by before formatting.
+_WORKOUT_SCORE_FIELDS = _compile_fields((
+    ("strain", "Strain", "", "", None),
+    ("average_heart_rate", "Avg Heart Rate", "", " bpm", None),
+    ("max_heart_rate", "Max Heart Rate", "", " bpm", None),
+    ("kilojoule", "Energy", "", " kJ", None),
+    ("distance_meter", "Distance", ".2f", " km", _M_TO_KM),
+    ("altitude_gain_meter", "Altitude Gain", "", " m", None),
+    ("altitude_change_meter", "Altitude Change", "", " m", None),
+))
+
+_SLEEP_SCORE_FIELDS = _compile_fields((
+    ("sleep_performance_percentage", "Performance", "", "%", None),
+    ("sleep_efficiency_percentage", "Efficiency", "", "%", None),
+    ("respiratory_rate", "Respiratory Rate", "", " breaths/min", None),
+))
+
+_SLEEP_STAGE_FIELDS = _compile_fields((
+    ("total_in_bed_time_milli", "Total Time in Bed", ".0f", " minutes", _MS_TO_MIN),
+    ("total_awake_time_milli", "Awake Time", ".0f", " minutes", _MS_TO_MIN),
+    ("total_light_sleep_time_milli", "Light Sleep", ".0f", " minutes", _MS_TO_MIN),
+    ("total_slow_wave_sleep_time_milli", "Deep Sleep", ".0f", " minutes", _MS_TO_MIN),
+    ("total_rem_sleep_time_milli", "REM Sleep", ".0f", " minutes", _MS_TO_MIN),
+))
+
+_RECOVERY_SCORE_FIELDS = _compile_fields((
+    ("recovery_score", "Recovery Score", "", "%", None),
+    ("resting_heart_rate", "Resting Heart Rate", "", " bpm", None),
+    ("hrv_rmssd_milli", "HRV", ".1f", " ms", None),
+    ("spo2_percentage", "SpO2", "", "%", None),
+    ("skin_temp_celsius", "Skin Temperature", ".1f", "°C", None),
+))
+
+_CYCLE_SCORE_FIELDS = _compile_fields((
+    ("strain", "Strain", "", "", None),
+    ("kilojoule", "Energy", "", " kJ", None),
+    ("average_heart_rate", "Avg Heart Rate", "", " bpm", None),
+    ("max_heart_rate", "Max Heart Rate", "", " bpm", None),
+))
+
+
+def _append_fields(
+    lines: list[str], data: dict[str, Any], fields: tuple[_ScoreField, ...]
+) -> None:
+    """Append a formatted line for each field in the table that has a value."""
+    append = lines.append
+    for key, prefix, spec, suffix, scale in fields:
+        value = data.get(key)
+        if value is None:
+            continue
+        if scale is not None:
+            value = value * scale
+        append(prefix + format(value, spec) + suffix)
+
+
+def format_workout(workout: dict[str, Any], lines: list[str]) -> None:
+    """Append the human-readable lines for a workout record to lines."""
     # Header with sport name (prioritise over less user-friendly ID)
-    sport = workout.get("sport_name", f"Sport ID {workout.get('sport_id', 'Unknown')}")
+    sport = workout.get("sport_name")
+    if sport is None:
+        sport = f"Sport ID {workout.get('sport_id', 'Unknown')}"
     start = workout.get("start", "")
     lines.append(f"Workout: {sport}")
     if start:
         lines.append(f"  Time: {start}")
 
     # Score data if available
-    if workout.get("score_state") == "SCORED" and "score" in workout:
-        score = workout["score"]
-        if "strain" in score and score["strain"] is not None:
-            lines.append(f"  Strain: {score['strain']}")
-        if "average_heart_rate" in score and score["average_heart_rate"] is not None:
-            lines.append(f"  Avg Heart Rate: {score['average_heart_rate']} bpm")
-        if "max_heart_rate" in score and score["max_heart_rate"] is not None:
-            lines.append(f"  Max Heart Rate: {score['max_heart_rate']} bpm")
-        if "kilojoule" in score and score["kilojoule"] is not None:
-            lines.append(f"  Energy: {score['kilojoule']} kJ")
-        if "distance_meter" in score and score["distance_meter"] is not None:
-            distance_km = score['distance_meter'] / 1000
-            lines.append(f"  Distance: {distance_km:.2f} km")
-        if "altitude_gain_meter" in score and score["altitude_gain_meter"] is not None:
-            lines.append(f"  Altitude Gain: {score['altitude_gain_meter']} m")
-        if "altitude_change_meter" in score and score["altitude_change_meter"] is not None:
-            lines.append(f"  Altitude Change: {score['altitude_change_meter']} m")
-
-    return "\n".join(lines)
+    if workout.get("score_state") == "SCORED" and (score := workout.get("score")) is not None:
+        _append_fields(lines, score, _WORKOUT_SCORE_FIELDS)
 
 
-def format_sleep(sleep: dict) -> str:
-    """Format a sleep record into human-readable text."""
-    lines = []
-
+def format_sleep(sleep: dict[str, Any], lines: list[str]) -> None:
+    """Append the human-readable lines for a sleep record to lines."""
     # Header
     start = sleep.get("start", "")
     end = sleep.get("end", "")
@@ -50,107 +114,67 @@ def format_sleep(sleep: dict) -> str:
     lines.append(f"{sleep_type}: {start} to {end}")
 
     # Score data if available
-    if sleep.get("score_state") == "SCORED" and "score" in sleep:
-        score = sleep["score"]
-
+    if sleep.get("score_state") == "SCORED" and (score := sleep.get("score")) is not None:
         # Performance metrics
-        if "sleep_performance_percentage" in score and score["sleep_performance_percentage"] is not None:
-            lines.append(f"  Performance: {score['sleep_performance_percentage']}%")
-        if "sleep_efficiency_percentage" in score and score["sleep_efficiency_percentage"] is not None:
-            lines.append(f"  Efficiency: {score['sleep_efficiency_percentage']}%")
-        if "respiratory_rate" in score and score["respiratory_rate"] is not None:
-            lines.append(f"  Respiratory Rate: {score['respiratory_rate']} breaths/min")
+        _append_fields(lines, score, _SLEEP_SCORE_FIELDS)
 
         # Stage breakdown
-        if "stage_summary" in score and score["stage_summary"] is not None:
-            stages = score["stage_summary"]
-            if "total_in_bed_time_milli" in stages and stages["total_in_bed_time_milli"] is not None:
-                total_mins = stages["total_in_bed_time_milli"] / 1000 / 60
-                lines.append(f"  Total Time in Bed: {total_mins:.0f} minutes")
-            if "total_awake_time_milli" in stages and stages["total_awake_time_milli"] is not None:
-                awake_mins = stages["total_awake_time_milli"] / 1000 / 60
-                lines.append(f"  Awake Time: {awake_mins:.0f} minutes")
-            if "total_light_sleep_time_milli" in stages and stages["total_light_sleep_time_milli"] is not None:
-                light_mins = stages["total_light_sleep_time_milli"] / 1000 / 60
-                lines.append(f"  Light Sleep: {light_mins:.0f} minutes")
-            if "total_slow_wave_sleep_time_milli" in stages and stages["total_slow_wave_sleep_time_milli"] is not None:
-                deep_mins = stages["total_slow_wave_sleep_time_milli"] / 1000 / 60
-                lines.append(f"  Deep Sleep: {deep_mins:.0f} minutes")
-            if "total_rem_sleep_time_milli" in stages and stages["total_rem_sleep_time_milli"] is not None:
-                rem_mins = stages["total_rem_sleep_time_milli"] / 1000 / 60
-                lines.append(f"  REM Sleep: {rem_mins:.0f} minutes")
-
-    return "\n".join(lines)
+        stages = score.get("stage_summary")
+        if stages is not None:
+            _append_fields(lines, stages, _SLEEP_STAGE_FIELDS)
 
 
-def format_recovery(recovery: dict) -> str:
-    """Format a recovery record into human-readable text."""
-    lines = []
-
+def format_recovery(recovery: dict[str, Any], lines: list[str]) -> None:
+    """Append the human-readable lines for a recovery record to lines."""
     # Header
     created = recovery.get("created_at", "")
     lines.append(f"Recovery: {created}")
 
     # Score data if available
-    if recovery.get("score_state") == "SCORED" and "score" in recovery:
-        score = recovery["score"]
-
-        if "recovery_score" in score and score["recovery_score"] is not None:
-            lines.append(f"  Recovery Score: {score['recovery_score']}%")
-        if "resting_heart_rate" in score and score["resting_heart_rate"] is not None:
-            lines.append(f"  Resting Heart Rate: {score['resting_heart_rate']} bpm")
-        if "hrv_rmssd_milli" in score and score["hrv_rmssd_milli"] is not None:
-            hrv = score["hrv_rmssd_milli"]
-            lines.append(f"  HRV: {hrv:.1f} ms")
-        if "spo2_percentage" in score and score["spo2_percentage"] is not None:
-            lines.append(f"  SpO2: {score['spo2_percentage']}%")
-        if "skin_temp_celsius" in score and score["skin_temp_celsius"] is not None:
-            lines.append(f"  Skin Temperature: {score['skin_temp_celsius']:.1f}°C")
-
-    return "\n".join(lines)
-
+    if recovery.get("score_state") == "SCORED" and (score := recovery.get("score")) is not None:
+        _append_fields(lines, score, _RECOVERY_SCORE_FIELDS)
 
-def format_cycle(cycle: dict) -> str:
-    """Format a cycle record into human-readable text."""
-    lines = []
 
+def format_cycle(cycle: dict[str, Any], lines: list[str]) -> None:
+    """Append the human-readable lines for a cycle record to lines."""
     # Header
     start = cycle.get("start", "")
     end = cycle.get("end", "In Progress")
     lines.append(f"Cycle: {start} to {end}")
 
     # Score data if available
-    if cycle.get("score_state") == "SCORED" and "score" in cycle:
-        score = cycle["score"]
-
-        if "strain" in score and score["strain"] is not None:
-            lines.append(f"  Strain: {score['strain']}")
-        if "kilojoule" in score and score["kilojoule"] is not None:
-            lines.append(f"  Energy: {score['kilojoule']} kJ")
-        if "average_heart_rate" in score and score["average_heart_rate"] is not None:
-            lines.append(f"  Avg Heart Rate: {score['average_heart_rate']} bpm")
-        if "max_heart_rate" in score and score["max_heart_rate"] is not None:
-            lines.append(f"  Max Heart Rate: {score['max_heart_rate']} bpm")
+    if cycle.get("score_state") == "SCORED" and (score := cycle.get("score")) is not None:
+        _append_fields(lines, score, _CYCLE_SCORE_FIELDS)
 
-    return "\n".join(lines)
 
+def format_response(
+    data: dict[str, Any], formatter_func: Callable[[dict[str, Any], list[str]], None]
+) -> str:
+    """
+    Format API response data using a specific formatter function.
 
-def format_response(data: dict, formatter_func) -> str:
-    """Format API response data using a specific formatter function."""
+    All records append to one list of lines that is joined once at the end,
+    so no intermediate string is built per record.
+    """
+    lines: list[str] = []
     if "records" in data:
         # Multiple records
         records = data["records"]
         if not records:
             return "No records found."
 
-        formatted_records = [formatter_func(record) for record in records]
-        result = "\n\n".join(formatted_records)
+        for record in records:
+            if lines:
+                # Blank line between records
+                lines.append("")
+            formatter_func(record, lines)
 
         # Add pagination info if available
-        if "next_token" in data:
-            result += "\n\n(More records available - use pagination)"
-
-        return result
+        if data.get("next_token"):
+            lines.append("")
+            lines.append("(More records available - use pagination)")
     else:
         # Single record or direct data
-        return formatter_func(data)
+        formatter_func(data, lines)
+
+    return "\n".join(lines)
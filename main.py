@@ -11,11 +11,19 @@ Requires OAuth 2.0 authentication.
 """
 
 import os
-import json
-from datetime import datetime, timedelta
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Optional
 from fastmcp import FastMCP
 
-from whoop_client import TokenManager, WhoopAPIClient
+from whoop_client import (
+    MAX_CONCURRENT_REQUESTS,
+    TokenManager,
+    WhoopAPIClient,
+    format_timestamp,
+)
 from formatters import (
     format_cycle,
     format_recovery,
@@ -24,7 +32,28 @@ from formatters import (
     format_response,
 )
 
-mcp = FastMCP("whoop-mcp")
+
+# FastMCP enters the lifespan once per session: once for the whole process
+# over stdio, but once per client session over the HTTP transports. The API
+# client's connection pool is shared by every session, so it is only closed
+# when the last active session ends (and reopened on next use).
+_active_sessions = 0
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Close the API client's HTTP connections when the last session ends."""
+    global _active_sessions
+    _active_sessions += 1
+    try:
+        yield
+    finally:
+        _active_sessions -= 1
+        if _active_sessions == 0 and _client is not None:
+            await _client.aclose()
+
+
+mcp = FastMCP("whoop-mcp", lifespan=lifespan)
 
 # OAuth credentials (to be set via environment variables), see README.md for instructions
 CLIENT_ID = os.getenv("WHOOP_CLIENT_ID")
@@ -32,23 +61,63 @@ CLIENT_SECRET = os.getenv("WHOOP_CLIENT_SECRET")
 ACCESS_TOKEN = os.getenv("WHOOP_ACCESS_TOKEN")
 REFRESH_TOKEN = os.getenv("WHOOP_REFRESH_TOKEN")
 
+# Where refreshed tokens are saved, so a restart doesn't fall back to the
+# (possibly already rotated) tokens from the environment
+TOKEN_STORE = Path(os.getenv("WHOOP_TOKEN_STORE", "~/.whoop-mcp-tokens.json")).expanduser()
+
+# Maximum number of WHOOP API requests in flight at once
+MAX_CONCURRENCY = os.getenv("WHOOP_MAX_CONCURRENCY", str(MAX_CONCURRENT_REQUESTS))
+
+# Client shared by all tools, so that a token refreshed during one tool call
+# is still used by the next
+_client: Optional[WhoopAPIClient] = None
+
 
 def get_client() -> WhoopAPIClient:
-    """Get an authenticated WHOOP API client."""
-    if not ACCESS_TOKEN:
+    """Get the authenticated WHOOP API client, creating it on first use."""
+    global _client
+    if _client is not None:
+        return _client
+
+    try:
+        max_concurrency = int(MAX_CONCURRENCY)
+    except ValueError:
+        max_concurrency = 0
+    if max_concurrency < 1:
         raise ValueError(
-            "WHOOP_ACCESS_TOKEN environment variable is not set. "
-            "Please set it to your WHOOP API access token."
+            f"WHOOP_MAX_CONCURRENCY must be a whole number of at least 1, got {MAX_CONCURRENCY!r}."
         )
 
-    # Create token manager with refresh token support
+    # Create token manager with refresh token support, preferring tokens
+    # saved by a previous run over the ones from the environment
     token_manager = TokenManager(
         ACCESS_TOKEN,
         REFRESH_TOKEN,
         CLIENT_ID,
-        CLIENT_SECRET
+        CLIENT_SECRET,
+        store_path=TOKEN_STORE,
     )
-    return WhoopAPIClient(token_manager)
+    token_manager.load_stored_tokens()
+
+    if not token_manager.access_token:
+        raise ValueError(
+            "WHOOP_ACCESS_TOKEN environment variable is not set. "
+            "Please set it to your WHOOP API access token."
+        )
+
+    _client = WhoopAPIClient(token_manager, max_concurrency=max_concurrency)
+    return _client
+
+
+def _recent_range(days: int) -> tuple[str, str]:
+    """
+    Get the ISO 8601 UTC start and end of the last N days.
+
+    The end is truncated to the minute so repeated calls share a cache key.
+    """
+    end_date = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+    start_date = end_date - timedelta(days=days)
+    return format_timestamp(start_date), format_timestamp(end_date)
 
 
 @mcp.tool(
@@ -56,195 +125,169 @@ def get_client() -> WhoopAPIClient:
     title="Get body measurements",
     description="Get the user's body measurements (height, weight, max HR)."
 )
-async def get_user_profile() -> str:
+async def get_user_profile() -> dict:
     """
     Get the authenticated WHOOP user's body measurements.
 
     Returns height (meters), weight (kilograms), and max heart rate.
     """
     client = get_client()
-    profile = await client.get_user_profile()
-    return json.dumps(profile, indent=2)
+    # Returned as-is so FastMCP serializes it once, as structured content
+    return await client.get_user_profile()
 
 
-@mcp.tool(
-    title="Get recent cycles",
-    description="Get recent physiological cycles with recovery data. A cycle is a 'sleep-to-sleep' cycle, which is typically a day."
-)
-async def get_recent_cycles(days: int = 7) -> str:
+def _register(tools: list[tuple], factory: Callable) -> None:
     """
-    Get recent physiological cycles with recovery data.
-
-    Args:
-        days: Number of days to look back (default 7)
-
-    Returns cycle data including strain, heart rate, and recovery scores.
+    Register a tool for each (name, title, description, WhoopAPIClient method,
+    formatter) entry, with a handler built by factory(method, formatter).
     """
-    client = get_client()
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=days)
-
-    cycles = await client.get_cycles(
-        start_date=start_date.isoformat() + "Z",
-        end_date=end_date.isoformat() + "Z"
-    )
-    return format_response(cycles, format_cycle)
+    for name, title, description, method, formatter in tools:
+        mcp.tool(name=name, title=title, description=description)(
+            factory(method, formatter)
+        )
 
 
-@mcp.tool(
-    title="Get recent recovery",
-    description="Get recent recovery scores and metrics. Recovery metrics include your recovery score, resting heart rate, HRV, blood oxygen saturation, and skin temperature."
-)
-async def get_recent_recovery(days: int = 7) -> str:
+# (name, title, description, WhoopAPIClient method, formatter) for each tool
+# that reports the last N days of one data type
+_RECENT_TOOLS = [
+    (
+        "get_recent_cycles",
+        "Get recent cycles",
+        "Get recent physiological cycles with recovery data. A cycle is a 'sleep-to-sleep' cycle, which is typically a day.",
+        "get_cycles",
+        format_cycle,
+    ),
+    (
+        "get_recent_recovery",
+        "Get recent recovery",
+        "Get recent recovery scores and metrics. Recovery metrics include your recovery score, resting heart rate, HRV, blood oxygen saturation, and skin temperature.",
+        "get_recovery",
+        format_recovery,
+    ),
+    (
+        "get_recent_sleep",
+        "Get recent sleep",
+        "Get recent sleep data and metrics. Sleep metrics include sleep stages, efficiency, and performance scores.",
+        "get_sleep",
+        format_sleep,
+    ),
+    (
+        "get_recent_workouts",
+        "Get recent workouts",
+        "Get recent workout data and activities. Data includes sport type, strain, duration, and heart rate zones.",
+        "get_workouts",
+        format_workout,
+    ),
+]
+
+
+def _make_recent_tool(method: str, formatter: Callable[[dict, list[str]], None]):
     """
-    Get recent recovery scores and metrics.
-
-    Args:
-        days: Number of days to look back (default 7)
-
-    Returns recovery data including HRV, resting heart rate, and recovery percentage.
+    Build a tool handler that formats every record of one data type from the
+    last `days` days (default 7).
     """
-    client = get_client()
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=days)
 
-    recovery = await client.get_recovery(
-        start_date=start_date.isoformat() + "Z",
-        end_date=end_date.isoformat() + "Z"
-    )
-    return format_response(recovery, format_recovery)
+    async def handler(days: int = 7) -> str:
+        client = get_client()
+        start_date, end_date = _recent_range(days)
 
+        data = await getattr(client, method)(start_date=start_date, end_date=end_date, fetch_all=True)
+        return format_response(data, formatter)
 
-@mcp.tool(
-    title="Get recent sleep",
-    description="Get recent sleep data and metrics. Sleep metrics include sleep stages, efficiency, and performance scores."
-)
-async def get_recent_sleep(days: int = 7) -> str:
-    """
-    Get recent sleep data and metrics.
+    return handler
 
-    Args:
-        days: Number of days to look back (default 7)
 
-    Returns sleep data including sleep stages, efficiency, and performance scores.
-    """
-    client = get_client()
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=days)
-
-    sleep = await client.get_sleep(
-        start_date=start_date.isoformat() + "Z",
-        end_date=end_date.isoformat() + "Z"
-    )
-    return format_response(sleep, format_sleep)
+_register(_RECENT_TOOLS, _make_recent_tool)
 
 
 @mcp.tool(
-    title="Get recent workouts",
-    description="Get recent workout data and activities. Data includes sport type, strain, duration, and heart rate zones."
+    title="Get recent summary",
+    description="Get recent cycles, recovery, sleep, and workouts in a single call. Use this for daily or weekly overviews instead of calling each tool separately."
 )
-async def get_recent_workouts(days: int = 7) -> str:
+async def get_recent_summary(days: int = 7) -> str:
     """
-    Get recent workout data and activities.
+    Get recent cycles, recovery, sleep, and workout data together.
+
+    The four WHOOP endpoints are queried concurrently, so this is faster than
+    calling the individual get_recent_* tools one after another.
 
     Args:
         days: Number of days to look back (default 7)
 
-    Returns workout data including sport type, strain, duration, and heart rate zones.
+    Returns a combined report with a section for each data type.
     """
     client = get_client()
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=days)
+    start, end = _recent_range(days)
 
-    workouts = await client.get_workouts(
-        start_date=start_date.isoformat() + "Z",
-        end_date=end_date.isoformat() + "Z"
+    cycles, recovery, sleep, workouts = await asyncio.gather(
+        client.get_cycles(start_date=start, end_date=end, fetch_all=True),
+        client.get_recovery(start_date=start, end_date=end, fetch_all=True),
+        client.get_sleep(start_date=start, end_date=end, fetch_all=True),
+        client.get_workouts(start_date=start, end_date=end, fetch_all=True),
     )
-    return format_response(workouts, format_workout)
 
-
-@mcp.tool(
-    title="Get cycles for date range",
-    description="Get physiological cycles for a specific date range."
-)
-async def get_cycles_for_date_range(
-    start_date: str,
-    end_date: str,
-    limit: int = 25
-) -> str:
+    sections = [
+        ("Cycles", format_response(cycles, format_cycle)),
+        ("Recovery", format_response(recovery, format_recovery)),
+        ("Sleep", format_response(sleep, format_sleep)),
+        ("Workouts", format_response(workouts, format_workout)),
+    ]
+    return "\n\n".join(f"## {title}\n\n{body}" for title, body in sections)
+
+
+# (name, title, description, WhoopAPIClient method, formatter) for each tool
+# that reports one data type over a caller-supplied date range
+_DATE_RANGE_TOOLS = [
+    (
+        "get_cycles_for_date_range",
+        "Get cycles for date range",
+        "Get physiological cycles for a specific date range. Set fetch_all to retrieve every cycle in the range rather than a single page.",
+        "get_cycles",
+        format_cycle,
+    ),
+    (
+        "get_sleep_for_date_range",
+        "Get sleep for date range",
+        "Get sleep data for a specific date range. Set fetch_all to retrieve every sleep in the range rather than a single page.",
+        "get_sleep",
+        format_sleep,
+    ),
+    (
+        "get_workouts_for_date_range",
+        "Get workouts for date range",
+        "Get workout data for a specific date range. Set fetch_all to retrieve every workout in the range rather than a single page.",
+        "get_workouts",
+        format_workout,
+    ),
+]
+
+
+def _make_date_range_tool(method: str, formatter: Callable[[dict, list[str]], None]):
     """
-    Get physiological cycles for a specific date range.
-
-    Args:
-        start_date: Start date in ISO 8601 format (e.g., "2024-01-01T00:00:00.000Z")
-        end_date: End date in ISO 8601 format
-        limit: Maximum number of records to return (default 25, max 50)
-
-    Returns cycle data including strain, heart rate, and recovery scores.
+    Build a tool handler that formats the records of one data type between
+    ISO 8601 start_date and end_date. It returns up to `limit` records
+    (default 25, max 50), or every record in the range if fetch_all is set.
     """
-    client = get_client()
-    cycles = await client.get_cycles(
-        start_date=start_date,
-        end_date=end_date,
-        limit=min(limit, 50)  # Cap at 50
-    )
-    return format_response(cycles, format_cycle)
-
-
-@mcp.tool(
-    title="Get sleep for date range",
-    description="Get sleep data for a specific date range."
-)
-async def get_sleep_for_date_range(
-    start_date: str,
-    end_date: str,
-    limit: int = 25
-) -> str:
-    """
-    Get sleep data for a specific date range.
-
-    Args:
-        start_date: Start date in ISO 8601 format (e.g., "2024-01-01T00:00:00.000Z")
-        end_date: End date in ISO 8601 format
-        limit: Maximum number of records to return (default 25, max 50)
-
-    Returns sleep data including sleep stages, efficiency, and performance scores.
-    """
-    client = get_client()
-    sleep = await client.get_sleep(
-        start_date=start_date,
-        end_date=end_date,
-        limit=min(limit, 50)  # Cap at 50
-    )
-    return format_response(sleep, format_sleep)
 
+    async def handler(
+        start_date: str,
+        end_date: str,
+        limit: int = 25,
+        fetch_all: bool = False
+    ) -> str:
+        client = get_client()
+        data = await getattr(client, method)(
+            start_date=start_date,
+            end_date=end_date,
+            limit=min(limit, 50),  # Cap at 50
+            fetch_all=fetch_all
+        )
+        return format_response(data, formatter)
 
-@mcp.tool(
-    title="Get workouts for date range",
-    description="Get workout data for a specific date range."
-)
-async def get_workouts_for_date_range(
-    start_date: str,
-    end_date: str,
-    limit: int = 25
-) -> str:
-    """
-    Get workout data for a specific date range.
+    return handler
 
-    Args:
-        start_date: Start date in ISO 8601 format (e.g., "2024-01-01T00:00:00.000Z")
-        end_date: End date in ISO 8601 format
-        limit: Maximum number of records to return (default 25, max 50)
 
-    Returns workout data including sport type, strain, duration, and heart rate zones.
-    """
-    client = get_client()
-    workouts = await client.get_workouts(
-        start_date=start_date,
-        end_date=end_date,
-        limit=min(limit, 50)  # Cap at 50
-    )
-    return format_response(workouts, format_workout)
+_register(_DATE_RANGE_TOOLS, _make_date_range_tool)
 
 
 if __name__ == "__main__":
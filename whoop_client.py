@@ -4,15 +4,136 @@ WHOOP API Client
 Handles authentication and API requests to the WHOOP API v2.
 """
 
+import asyncio
+import functools
+import hashlib
 import logging
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import Optional
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
 API_BASE_URL = "https://api.prod.whoop.com"
 TOKEN_URL = f"{API_BASE_URL}/oauth/oauth2/token"
 
+# How long GET responses are reused before being fetched again
+CACHE_TTL_SECONDS = 60.0
+CACHE_MAX_ENTRIES = 128
+
+# Number of sub-ranges fetched concurrently when retrieving every record in a range
+FETCH_ALL_SLICES = 4
+
+# Default upper bound on API requests in flight at once per client, to stay
+# under WHOOP's rate limit when the summary tool and fetch_all fan out
+MAX_CONCURRENT_REQUESTS = 5
+
+# Retries of a rate-limited (429) request before giving up. Without a
+# Retry-After header, the wait doubles from RATE_LIMIT_BACKOFF_SECONDS.
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF_SECONDS = 1.0
+RATE_LIMIT_MAX_DELAY_SECONDS = 30.0
+
+# Refresh the access token this many seconds before it is due to expire
+TOKEN_REFRESH_MARGIN_SECONDS = 60.0
+
+# Shared HTTP client so that requests reuse pooled keep-alive connections
+# instead of paying a TCP + TLS handshake on every call. HTTP/2 lets concurrent
+# requests to the API multiplex over a single connection.
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            base_url=API_BASE_URL,
+            timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and release its pooled connections."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> Optional[float]:
+    """
+    Get how long to wait before retrying a rate-limited request.
+
+    Returns None if the server asks for a longer wait than
+    RATE_LIMIT_MAX_DELAY_SECONDS, in which case the request should fail.
+    """
+    try:
+        delay = float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        delay = RATE_LIMIT_BACKOFF_SECONDS * 2 ** attempt
+    if delay > RATE_LIMIT_MAX_DELAY_SECONDS:
+        return None
+    return max(delay, 0.0)
+
+
+def _token_fingerprint(token: Optional[str]) -> Optional[str]:
+    """Hash a token so the token store can identify it without keeping a copy."""
+    if not token:
+        return None
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, treating naive values as UTC."""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def format_timestamp(value: datetime) -> str:
+    """
+    Format a datetime as the ISO 8601 UTC string the WHOOP API expects.
+
+    Aware values are converted to UTC; naive values are treated as UTC.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def _split_range(start_date: str, end_date: str, slices: int) -> list[tuple[str, str]]:
+    """
+    Split a date range into contiguous sub-ranges, newest first.
+
+    Returns an empty list if the range is empty or inverted.
+    """
+    start = _parse_timestamp(start_date)
+    end = _parse_timestamp(end_date)
+    if end <= start:
+        return []
+
+    step = (end - start) / slices
+    bounds = [start_date]
+    bounds += [format_timestamp(start + step * i) for i in range(1, slices)]
+    bounds.append(end_date)
+    # Bounds are truncated to milliseconds, so a range only a few milliseconds
+    # wide can produce sub-ranges that are empty
+    return [
+        (bounds[i], bounds[i + 1])
+        for i in reversed(range(slices))
+        if _parse_timestamp(bounds[i]) < _parse_timestamp(bounds[i + 1])
+    ]
+
 
 class TokenManager:
     """Manages access and refresh tokens with automatic refresh."""
@@ -23,14 +144,141 @@ class TokenManager:
         refresh_token: Optional[str] = None,
         client_id: Optional[str] = None,
         client_secret: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        store_path: Optional[Path] = None,
     ):
         self.access_token = access_token
         self.refresh_token = refresh_token
         self.client_id = client_id
         self.client_secret = client_secret
+        # Client to post token refreshes with (defaults to the shared client)
+        self.http_client = http_client
+        # File that refreshed tokens are saved to, so they survive a restart
+        self.store_path = store_path
+        # Identifies the refresh token the manager was configured with, so
+        # saved tokens are only reused while that configuration is unchanged
+        self._source_fingerprint = _token_fingerprint(refresh_token)
+        # Monotonic deadline of the current access token, if known. Tokens
+        # passed in from the environment have no known expiry.
+        self.expires_at: Optional[float] = None
+        # Serializes refreshes so concurrent requests don't all hit the token endpoint
+        self._refresh_lock = asyncio.Lock()
+
+    @property
+    def access_token(self) -> str:
+        """The current access token."""
+        return self._access_token
+
+    @access_token.setter
+    def access_token(self, value: str) -> None:
+        self._access_token = value
+        # Built once per token instead of on every request
+        self.auth_headers = {"Authorization": f"Bearer {value}"}
+
+    def load_stored_tokens(self) -> bool:
+        """
+        Replace the tokens with ones saved by a previous run.
+
+        Saved tokens are ignored if they were derived from a different refresh
+        token than the one this manager was configured with, so new tokens
+        put in the environment take precedence over an older store.
+
+        Returns:
+            Whether tokens were loaded from the token store
+        """
+        if self.store_path is None:
+            return False
+        try:
+            stored = orjson.loads(self.store_path.read_bytes())
+        except FileNotFoundError:
+            return False
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning("Ignoring unreadable token store %s: %s", self.store_path, e)
+            return False
+        if not isinstance(stored, dict):
+            logger.warning("Ignoring unreadable token store %s: not a JSON object", self.store_path)
+            return False
+        if not stored.get("access_token") or not isinstance(stored["access_token"], str):
+            return False
+        if stored.get("source_fingerprint") != self._source_fingerprint:
+            logger.info("Ignoring token store %s saved for different credentials", self.store_path)
+            return False
+
+        self.access_token = stored["access_token"]
+        refresh_token = stored.get("refresh_token")
+        if refresh_token and isinstance(refresh_token, str):
+            self.refresh_token = refresh_token
+        # Stored as wall-clock time, since monotonic time doesn't carry across runs
+        expires_at = stored.get("expires_at")
+        if isinstance(expires_at, (int, float)):
+            self.expires_at = time.monotonic() + (expires_at - time.time())
+        logger.info("Loaded tokens from %s", self.store_path)
+        return True
+
+    def _save_tokens(self) -> None:
+        """Write the current tokens to the token store, if one is configured."""
+        if self.store_path is None:
+            return
+
+        expires_at = None
+        if self.expires_at is not None:
+            expires_at = time.time() + (self.expires_at - time.monotonic())
+        data = orjson.dumps({
+            "access_token": self.access_token,
+            "refresh_token": self.refresh_token,
+            "expires_at": expires_at,
+            "source_fingerprint": self._source_fingerprint,
+        })
+
+        # Write to a temporary file and rename it over the store, so a crash
+        # mid-write can't leave a truncated file behind
+        tmp_path = self.store_path.with_name(self.store_path.name + ".tmp")
+        try:
+            self.store_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.store_path)
+        except OSError as e:
+            logger.warning("Failed to save tokens to %s: %s", self.store_path, e)
+
+    def _is_expiring(self) -> bool:
+        """Check whether the access token is known to be about to expire."""
+        if self.expires_at is None or not self.refresh_token:
+            return False
+        return self.expires_at - time.monotonic() < TOKEN_REFRESH_MARGIN_SECONDS
+
+    async def get_valid_token(self) -> str:
+        """Get the access token, refreshing it first if it is about to expire."""
+        if self._is_expiring():
+            async with self._refresh_lock:
+                # Another request may have refreshed while we waited for the lock
+                if self._is_expiring():
+                    logger.info("Access token about to expire, refreshing...")
+                    await self._request_new_token()
+        return self.access_token
+
+    async def refresh_access_token(self, stale_token: Optional[str] = None) -> str:
+        """
+        Refresh the access token using the refresh token.
+
+        Args:
+            stale_token: The token a failed request was sent with. If another
+                request has already replaced it, the current token is returned
+                without calling the token endpoint again.
+        """
+        async with self._refresh_lock:
+            if stale_token is not None and self.access_token != stale_token:
+                return self.access_token
+            return await self._request_new_token()
 
-    async def refresh_access_token(self) -> str:
-        """Refresh the access token using the refresh token."""
+    async def _request_new_token(self) -> str:
+        """
+        Exchange the refresh token for a new access token.
+
+        Callers must hold the refresh lock, which also serializes writes to
+        the token store.
+        """
         if not self.refresh_token:
             raise ValueError("No refresh token available. Please re-authenticate.")
 
@@ -46,99 +294,254 @@ class TokenManager:
             "client_secret": self.client_secret,
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.post(TOKEN_URL, data=data)
-                response.raise_for_status()
-                token_data = response.json()
+        client = self.http_client or get_http_client()
+        try:
+            response = await client.post(TOKEN_URL, data=data)
+            response.raise_for_status()
+            token_data = orjson.loads(response.content)
 
-                self.access_token = token_data["access_token"]
-                if "refresh_token" in token_data:
-                    self.refresh_token = token_data["refresh_token"]
+            self.access_token = token_data["access_token"]
+            if "refresh_token" in token_data:
+                self.refresh_token = token_data["refresh_token"]
+            self.expires_at = time.monotonic() + token_data.get("expires_in", 3600)
+            self._save_tokens()
 
-                logger.info("Access token refreshed successfully")
-                return self.access_token
+            logger.info("Access token refreshed successfully")
+            return self.access_token
 
-            except httpx.HTTPStatusError as e:
-                logger.error(f"Failed to refresh token: {e}")
-                raise ValueError(
-                    "Failed to refresh access token. Please re-authenticate using bootstrap.py"
-                )
-            except Exception as e:
-                logger.error(f"Error refreshing token: {e}")
-                raise
+        except httpx.HTTPStatusError as e:
+            logger.error("Failed to refresh token: %s", e)
+            raise ValueError(
+                "Failed to refresh access token. Please re-authenticate using bootstrap.py"
+            )
+        except Exception as e:
+            logger.error("Error refreshing token: %s", e)
+            raise
 
 
 class WhoopAPIClient:
     """Client for interacting with the WHOOP API v2."""
 
-    def __init__(self, token_manager: TokenManager):
+    def __init__(
+        self,
+        token_manager: TokenManager,
+        http_client: Optional[httpx.AsyncClient] = None,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    ):
+        """
+        Args:
+            token_manager: Provides and refreshes the access token
+            http_client: Client to send requests with, which must have its
+                base_url set to the WHOOP API (defaults to the shared client)
+            max_concurrency: Maximum number of API requests in flight at once
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
         self.token_manager = token_manager
-        self.base_url = API_BASE_URL
+        self._http_client = http_client
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # Refresh tokens over the same connection pool as API requests
+        if http_client is not None and token_manager.http_client is None:
+            token_manager.http_client = http_client
+        self._cache: OrderedDict[tuple, tuple[float, bytes]] = OrderedDict()
+        self._in_flight: dict[tuple, asyncio.Future] = {}
+
+    async def aclose(self) -> None:
+        """Close the HTTP client this instance sends requests with."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+        else:
+            await close_http_client()
+
+    async def _get(self, path: str, **kwargs) -> bytes:
+        """Make a GET request with automatic token refresh on 401, returning the raw body."""
+        await self.token_manager.get_valid_token()
+
+        client = self._http_client or get_http_client()
+
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            async with self._semaphore:
+                try:
+                    sent_token = self.token_manager.access_token
+                    response = await client.get(
+                        path, headers=self.token_manager.auth_headers, **kwargs
+                    )
+
+                    # Refresh and retry once on 401 Unauthorized. Concurrent requests
+                    # that failed with the same token share a single refresh.
+                    if response.status_code == 401 and self.token_manager.refresh_token:
+                        logger.info("Access token expired, attempting refresh...")
+                        await self.token_manager.refresh_access_token(stale_token=sent_token)
+                        response = await client.get(
+                            path, headers=self.token_manager.auth_headers, **kwargs
+                        )
+
+                except httpx.RequestError as e:
+                    logger.error("Network error occurred: %s", e)
+                    raise ValueError(f"Failed to connect to WHOOP API: {str(e)}")
+
+            # Back off and retry on 429, outside the semaphore so the wait
+            # doesn't hold up other requests' slots
+            if response.status_code != 429 or attempt == RATE_LIMIT_RETRIES:
+                break
+            delay = _retry_delay(response, attempt)
+            if delay is None:
+                break
+            logger.warning("Rate limited, retrying in %.1f seconds...", delay)
+            await asyncio.sleep(delay)
+
+        # Handle HTTP errors
+        if response.status_code == 429:
+            logger.error("Rate limit exceeded.")
+            raise ValueError("WHOOP API rate limit exceeded. Please try again later.")
+        elif response.status_code == 401:
+            logger.error("Authentication failed.")
+            raise ValueError("Invalid or expired access token. Please re-authenticate.")
+        elif response.is_error:
+            logger.error("HTTP error occurred: %s %s", response.status_code, response.reason_phrase)
+            response.raise_for_status()
+
+        return response.content
+
+    async def _cached_get(self, path: str, params: Optional[dict] = None) -> dict:
+        """
+        Make a GET request, reusing a recent response for the same path and params.
 
-    def _get_headers(self) -> dict:
-        """Get authorization headers for API requests."""
-        return {
-            "Authorization": f"Bearer {self.token_manager.access_token}",
-            "Content-Type": "application/json"
-        }
+        Responses are cached for CACHE_TTL_SECONDS with least-recently-used
+        eviction, so repeated queries for overlapping windows within a session
+        don't hit the API again. Concurrent misses for the same key share a
+        single request. The raw response body is cached and decoded for each
+        caller, so a caller mutating its result can't corrupt the cache.
+        """
+        key = (path, tuple(sorted((params or {}).items())))
+        cached = self._cache.get(key)
+        if cached is not None:
+            fetched_at, content = cached
+            if time.monotonic() - fetched_at < CACHE_TTL_SECONDS:
+                self._cache.move_to_end(key)
+                return orjson.loads(content)
+            del self._cache[key]
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            return orjson.loads(await asyncio.shield(in_flight))
+
+        # Shielded so that one cancelled caller doesn't cancel the request
+        # for everyone else waiting on it. The response is cached when the
+        # request finishes, even if the caller that started it has gone.
+        request = asyncio.ensure_future(self._get(path, params=params))
+        self._in_flight[key] = request
+        request.add_done_callback(functools.partial(self._finish_request, key))
+        return orjson.loads(await asyncio.shield(request))
+
+    def _finish_request(self, key: tuple, request: asyncio.Future) -> None:
+        """Cache the response of a finished shared request and stop sharing it."""
+        if self._in_flight.get(key) is request:
+            del self._in_flight[key]
+        if request.cancelled() or request.exception() is not None:
+            return
+
+        self._cache[key] = (time.monotonic(), request.result())
+        self._cache.move_to_end(key)
+        if len(self._cache) > CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+
+    async def _get_collection(
+        self,
+        path: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        limit: int,
+        fetch_all: bool = False
+    ) -> dict:
+        """
+        Get records from a date-filtered collection endpoint.
+
+        Returns a single page unless fetch_all is set, in which case every
+        record in the range is returned. The first page covers the whole
+        range, so short ranges still cost one request. If more pages remain,
+        the rest of the range (older than the last record received) is split
+        into FETCH_ALL_SLICES sub-ranges that are paged through concurrently,
+        and records returned by more than one request are kept only once.
+        """
+        first_page = await self._get_page(path, start_date, end_date, limit)
+        next_token = first_page.get("next_token")
+        if not fetch_all or not next_token:
+            return first_page
+
+        records = list(first_page.get("records", []))
+        oldest_start = records[-1].get("start") if records else None
+        # Records are returned newest first, so everything still missing
+        # started before the last record on the first page
+        ranges = []
+        if start_date and oldest_start:
+            ranges = _split_range(start_date, oldest_start, FETCH_ALL_SLICES)
+        if ranges:
+            pages = await asyncio.gather(*(
+                self._get_all_pages(path, start, end, limit)
+                for start, end in ranges
+            ))
+        else:
+            # Nothing to split, e.g. because the last record overlaps the range
+            # but started before start_date, so follow next_token instead
+            pages = [await self._get_all_pages(path, start_date, end_date, limit, next_token)]
+
+        # WHOOP returns every record that overlaps a window, so a record that
+        # spans a boundary between sub-ranges comes back from both of them
+        seen = {record.get("id") for record in records}
+        for page in pages:
+            for record in page:
+                record_id = record.get("id")
+                if record_id is None or record_id not in seen:
+                    seen.add(record_id)
+                    records.append(record)
+        return {"records": records}
+
+    async def _get_page(
+        self,
+        path: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        limit: int,
+        next_token: Optional[str] = None
+    ) -> dict:
+        """Get one page of a date-filtered collection endpoint."""
+        params = {"limit": limit}
+        params.update(
+            (key, value)
+            for key, value in (("start", start_date), ("end", end_date), ("nextToken", next_token))
+            if value
+        )
+        return await self._cached_get(path, params)
 
-    async def _make_request(self, method: str, url: str, **kwargs) -> dict:
-        """Make an HTTP request with automatic token refresh on 401."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                if method == "GET":
-                    response = await client.get(url, headers=self._get_headers(), **kwargs)
-                elif method == "POST":
-                    response = await client.post(url, headers=self._get_headers(), **kwargs)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
-
-                response.raise_for_status()
-                return response.json()
-
-            except httpx.HTTPStatusError as e:
-                # Try to refresh token on 401 Unauthorized
-                if e.response.status_code == 401 and self.token_manager.refresh_token:
-                    logger.info("Access token expired, attempting refresh...")
-                    await self.token_manager.refresh_access_token()
-
-                    # Retry the request with new token
-                    if method == "GET":
-                        response = await client.get(url, headers=self._get_headers(), **kwargs)
-                    elif method == "POST":
-                        response = await client.post(url, headers=self._get_headers(), **kwargs)
-
-                    response.raise_for_status()
-                    return response.json()
-
-                # Handle other HTTP errors
-                elif e.response.status_code == 429:
-                    logger.error("Rate limit exceeded.")
-                    raise ValueError("WHOOP API rate limit exceeded. Please try again later.")
-                elif e.response.status_code == 401:
-                    logger.error("Authentication failed and no refresh token available.")
-                    raise ValueError("Invalid or expired access token. Please re-authenticate.")
-                else:
-                    logger.error(f"HTTP error occurred: {e}")
-                    raise
-
-            except httpx.RequestError as e:
-                logger.error(f"Network error occurred: {e}")
-                raise ValueError(f"Failed to connect to WHOOP API: {str(e)}")
+    async def _get_all_pages(
+        self,
+        path: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        limit: int,
+        next_token: Optional[str] = None
+    ) -> list:
+        """Get every record in a range by following next_token until exhausted."""
+        records = []
+        while True:
+            page = await self._get_page(path, start_date, end_date, limit, next_token)
+            records.extend(page.get("records", []))
+            next_token = page.get("next_token")
+            if not next_token:
+                return records
 
     async def get_user_profile(self) -> dict:
         """Get the authenticated user's body measurements (height, weight, max HR)."""
-        return await self._make_request(
-            "GET",
-            f"{self.base_url}/developer/v2/user/measurement/body"
-        )
+        return await self._cached_get("/developer/v2/user/measurement/body")
 
     async def get_cycles(
         self,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-        limit: int = 25
+        limit: int = 25,
+        fetch_all: bool = False
     ) -> dict:
         """
         Get physiological cycles for a date range.
@@ -146,25 +549,20 @@ class WhoopAPIClient:
         Args:
             start_date: ISO 8601 formatted start date (e.g., "2024-01-01T00:00:00.000Z")
             end_date: ISO 8601 formatted end date
-            limit: Maximum number of records to return (default 25)
+            limit: Maximum number of records to return (default 25), or the
+                page size when fetch_all is set
+            fetch_all: Follow pagination and return every record in the range
         """
-        params = {"limit": limit}
-        if start_date:
-            params["start"] = start_date
-        if end_date:
-            params["end"] = end_date
-
-        return await self._make_request(
-            "GET",
-            f"{self.base_url}/developer/v2/cycle",
-            params=params
+        return await self._get_collection(
+            "/developer/v2/cycle", start_date, end_date, limit, fetch_all
         )
 
     async def get_recovery(
         self,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-        limit: int = 25
+        limit: int = 25,
+        fetch_all: bool = False
     ) -> dict:
         """
         Get recovery data for a date range.
@@ -172,25 +570,20 @@ class WhoopAPIClient:
         Args:
             start_date: ISO 8601 formatted start date
             end_date: ISO 8601 formatted end date
-            limit: Maximum number of records to return (default 25)
+            limit: Maximum number of records to return (default 25), or the
+                page size when fetch_all is set
+            fetch_all: Follow pagination and return every record in the range
         """
-        params = {"limit": limit}
-        if start_date:
-            params["start"] = start_date
-        if end_date:
-            params["end"] = end_date
-
-        return await self._make_request(
-            "GET",
-            f"{self.base_url}/developer/v2/recovery",
-            params=params
+        return await self._get_collection(
+            "/developer/v2/recovery", start_date, end_date, limit, fetch_all
         )
 
     async def get_sleep(
         self,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-        limit: int = 25
+        limit: int = 25,
+        fetch_all: bool = False
     ) -> dict:
         """
         Get sleep data for a date range.
@@ -198,25 +591,20 @@ class WhoopAPIClient:
         Args:
             start_date: ISO 8601 formatted start date
             end_date: ISO 8601 formatted end date
-            limit: Maximum number of records to return (default 25)
+            limit: Maximum number of records to return (default 25), or the
+                page size when fetch_all is set
+            fetch_all: Follow pagination and return every record in the range
         """
-        params = {"limit": limit}
-        if start_date:
-            params["start"] = start_date
-        if end_date:
-            params["end"] = end_date
-
-        return await self._make_request(
-            "GET",
-            f"{self.base_url}/developer/v2/activity/sleep",
-            params=params
+        return await self._get_collection(
+            "/developer/v2/activity/sleep", start_date, end_date, limit, fetch_all
         )
 
     async def get_workouts(
         self,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-        limit: int = 25
+        limit: int = 25,
+        fetch_all: bool = False
     ) -> dict:
         """
         Get workout data for a date range.
@@ -224,16 +612,10 @@ class WhoopAPIClient:
         Args:
             start_date: ISO 8601 formatted start date
             end_date: ISO 8601 formatted end date
-            limit: Maximum number of records to return (default 25)
+            limit: Maximum number of records to return (default 25), or the
+                page size when fetch_all is set
+            fetch_all: Follow pagination and return every record in the range
         """
-        params = {"limit": limit}
-        if start_date:
-            params["start"] = start_date
-        if end_date:
-            params["end"] = end_date
-
-        return await self._make_request(
-            "GET",
-            f"{self.base_url}/developer/v2/activity/workout",
-            params=params
+        return await self._get_collection(
+            "/developer/v2/activity/workout", start_date, end_date, limit, fetch_all
         )